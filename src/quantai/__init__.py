@@ -7,5 +7,22 @@ __version__ = "2.0.0"
 __author__ = "QuantAI Team"
 
 from .logger import get_logger, QuantLogger
-from .database import get_database, DatabaseManager, TradeSignal
-from .visualization import ASCIIChart
+
+_LAZY_EXPORTS = {
+    "get_database": ".database",
+    "DatabaseManager": ".database",
+    "TradeSignal": ".database",
+    "ASCIIChart": ".visualization",
+}
+
+
+def __getattr__(name: str):
+    """Resolve database and visualization exports on first access (PEP 562)"""
+    if name in _LAZY_EXPORTS:
+        import importlib
+        
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
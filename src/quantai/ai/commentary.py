@@ -2,29 +2,57 @@
 AI Commentary Generator using Groq
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from ..config import settings
 
+if TYPE_CHECKING:
+    from groq import Groq
+
+
+_GROQ_CLIENT: Optional["Groq"] = None
+
+
+def _init_client() -> Optional["Groq"]:
+    """
+    Get the shared Groq client, creating it on first use
+    
+    One client (and its HTTP connection pool) is reused across analyses so
+    later requests skip the TCP/TLS handshake. HTTP/2 is used when the `h2`
+    package is installed.
+    
+    Returns:
+        Groq client, or None if no API key is configured or setup fails
+    """
+    global _GROQ_CLIENT
+    if _GROQ_CLIENT is not None:
+        return _GROQ_CLIENT
+    
+    if not settings.groq_api_key:
+        return None
+    
+    try:
+        import httpx
+        from groq import Groq
+        
+        try:
+            http_client = httpx.Client(http2=True, timeout=10.0)
+        except ImportError:
+            http_client = httpx.Client(timeout=10.0)
+        
+        _GROQ_CLIENT = Groq(api_key=settings.groq_api_key, http_client=http_client)
+    except Exception:
+        return None
+    
+    return _GROQ_CLIENT
+
 
 class AICommentary:
     """Generates AI-powered market commentary using Groq"""
     
     def __init__(self):
-        self.client = None
+        self.client: Optional["Groq"] = None
         self._commentary: str = None
     
-    def _init_client(self) -> bool:
-        """Initialize Groq client if API key is available"""
-        if not settings.groq_api_key:
-            return False
-        
-        try:
-            from groq import Groq
-            self.client = Groq(api_key=settings.groq_api_key)
-            return True
-        except Exception:
-            return False
-    
     def generate(
         self,
         ticker: str,
@@ -46,7 +74,8 @@ class AICommentary:
         Returns:
             Generated commentary string
         """
-        if not self._init_client():
+        self.client = _init_client()
+        if self.client is None:
             self._commentary = self._generate_fallback(
                 ticker, regime_data, model_data, sizing_data, current_price
             )
@@ -20,7 +20,6 @@ from .risk import RegimeDetector, KellySizer
 from .models import EnsemblePredictor
 from .ai import AICommentary
 from .logger import get_logger
-from .database import get_database
 from .visualization import ASCIIChart
 from . import __version__
 
@@ -264,6 +263,8 @@ def analyze(
         
         loader = DataLoader(ticker)
         data = loader.fetch(lookback_days=days)
+        # The company name is only needed for the report; fetch it meanwhile
+        loader.prefetch_info()
         
         console.print("[INFO] Engineering features...")
         engineer = FeatureEngineer(data)
@@ -299,6 +300,8 @@ def analyze(
         sizing_data = sizer.get_summary()
         
         console.print("[INFO] Saving signal to database...")
+        from .database import get_database
+        
         db = get_database()
         ensemble_data = model_data.get('ensemble', {})
         signal_id = db.save_signal(
@@ -385,6 +388,8 @@ def history(
     """
     View historical analysis signals from the database.
     """
+    from .database import get_database
+    
     db = get_database()
     
     if ticker:
@@ -4,50 +4,51 @@ Handles environment variables and application settings via .env file
 """
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class Settings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables"""
     
-    groq_api_key: Optional[str] = Field(
+    groq_api_key: Optional[str] = field(
         default_factory=lambda: os.getenv("GROQ_API_KEY"),
-        description="Groq API key for AI commentary"
+        metadata={"description": "Groq API key for AI commentary"}
     )
     
-    default_lookback_days: int = Field(
+    default_lookback_days: int = field(
         default=252,
-        description="Default number of trading days to fetch"
+        metadata={"description": "Default number of trading days to fetch"}
     )
     
-    reports_dir: Path = Field(
+    reports_dir: Path = field(
         default=Path("reports"),
-        description="Directory for generated reports"
+        metadata={"description": "Directory for generated reports"}
     )
     
-    logs_dir: Path = Field(
+    logs_dir: Path = field(
         default=Path("logs"),
-        description="Directory for system logs"
+        metadata={"description": "Directory for system logs"}
     )
     
-    database_path: Path = Field(
+    database_path: Path = field(
         default=Path("trade_history.db"),
-        description="Path to SQLite database file"
+        metadata={"description": "Path to SQLite database file"}
     )
     
-    n_regimes: int = Field(
+    n_regimes: int = field(
         default=3,
-        description="Number of market regimes for HMM"
+        metadata={"description": "Number of market regimes for HMM"}
     )
     
-    groq_model: str = Field(
+    groq_model: str = field(
         default="llama-3.1-8b-instant",
-        description="Groq model for AI commentary"
+        metadata={"description": "Groq model for AI commentary"}
     )
     
     def ensure_reports_dir(self) -> None:
@@ -0,0 +1,199 @@
+"""
+Numba kernels for technical indicators
+
+Every kernel carries an explicit signature, so it is compiled when this
+module is imported and the machine code is cached under __pycache__.
+Later CLI runs load the cached code instead of recompiling.
+Kernels read 1-D float64 arrays and write float32 results into
+caller-provided output columns, usually views into FeatureEngineer's buffer.
+
+Missing (non-finite) inputs follow pandas: a rolling window that contains
+one yields NaN until it leaves the window, and the EMAs hold their value
+across a gap, so one bad bar never poisons the rest of the series.
+"""
+
+import numpy as np
+from numba import njit, types
+
+# Inputs are typed read-only so that copy-on-write pandas views are accepted
+# without a copy; writable arrays convert to this type implicitly. Outputs
+# use "A" layout so strided column views of a 2-D buffer are accepted.
+_F8_IN = types.Array(types.float64, 1, "A", readonly=True)
+_F4_OUT = types.Array(types.float32, 1, "A")
+
+# Fast-math without the "no NaN / no inf" assumptions (same set as
+# risk._hmm_numba): the kernels write NaN warm-up values and test inputs
+# for NaN, which "nnan" would let the compiler fold away.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(types.void(_F8_IN, _F8_IN, types.int64, _F4_OUT), cache=True, fastmath=_FASTMATH)
+def _rsi(gain: np.ndarray, loss: np.ndarray, period: int, out: np.ndarray) -> None:
+    """
+    Relative Strength Index from per-bar gains and losses
+    
+    Rolling simple averages are kept as running sums so each input is
+    walked once. Output i covers bars i - period + 1 .. i, like a pandas
+    rolling(period).mean(); windows holding a non-finite gain or loss are
+    NaN and the sums only ever include finite values.
+    """
+    n = gain.shape[0]
+    gain_sum = 0.0
+    loss_sum = 0.0
+    n_bad = 0
+    
+    for i in range(n):
+        if np.isfinite(gain[i]) and np.isfinite(loss[i]):
+            gain_sum += gain[i]
+            loss_sum += loss[i]
+        else:
+            n_bad += 1
+        
+        if i >= period:
+            j = i - period
+            if np.isfinite(gain[j]) and np.isfinite(loss[j]):
+                gain_sum -= gain[j]
+                loss_sum -= loss[j]
+            else:
+                n_bad -= 1
+        
+        if i < period - 1 or n_bad > 0:
+            out[i] = np.nan
+        elif loss_sum > 0:
+            out[i] = 100 - 100 / (1 + gain_sum / loss_sum)
+        elif gain_sum > 0:
+            out[i] = 100.0
+        else:
+            out[i] = np.nan
+
+
+@njit(types.void(_F8_IN, _F4_OUT, _F4_OUT, _F4_OUT, _F4_OUT), cache=True)
+def _rolling_bundle(
+    close: np.ndarray,
+    sma5: np.ndarray,
+    sma20: np.ndarray,
+    sma50: np.ndarray,
+    bb_width: np.ndarray
+) -> None:
+    """
+    Rolling SMA 5/20/50 and Bollinger band width in one pass over Close
+    
+    Prices are offset by the first finite close before summing so the
+    running sum of squares does not lose precision. The 20-day standard
+    deviation uses ddof=1 like pandas; band width is (upper - lower) /
+    middle with bands at +/- 2 standard deviations. Each window counts its
+    non-finite closes, which are left out of the sums, and is NaN while
+    that count is non-zero.
+    """
+    n = close.shape[0]
+    
+    base = 0.0
+    for i in range(n):
+        if np.isfinite(close[i]):
+            base = close[i]
+            break
+    
+    sum_5 = 0.0
+    sum_20 = 0.0
+    sum_50 = 0.0
+    sumsq_20 = 0.0
+    bad_5 = 0
+    bad_20 = 0
+    bad_50 = 0
+    
+    for i in range(n):
+        if np.isfinite(close[i]):
+            x = close[i] - base
+            sum_5 += x
+            sum_20 += x
+            sum_50 += x
+            sumsq_20 += x * x
+        else:
+            bad_5 += 1
+            bad_20 += 1
+            bad_50 += 1
+        
+        if i >= 5:
+            if np.isfinite(close[i - 5]):
+                sum_5 -= close[i - 5] - base
+            else:
+                bad_5 -= 1
+        if i >= 20:
+            if np.isfinite(close[i - 20]):
+                old = close[i - 20] - base
+                sum_20 -= old
+                sumsq_20 -= old * old
+            else:
+                bad_20 -= 1
+        if i >= 50:
+            if np.isfinite(close[i - 50]):
+                sum_50 -= close[i - 50] - base
+            else:
+                bad_50 -= 1
+        
+        sma5[i] = base + sum_5 / 5 if i >= 4 and bad_5 == 0 else np.nan
+        
+        if i >= 19 and bad_20 == 0:
+            mean_20 = sum_20 / 20
+            middle = base + mean_20
+            var_20 = (sumsq_20 - 20 * mean_20 * mean_20) / 19
+            sma20[i] = middle
+            bb_width[i] = 4 * np.sqrt(max(var_20, 0.0)) / middle
+        else:
+            sma20[i] = np.nan
+            bb_width[i] = np.nan
+        
+        sma50[i] = base + sum_50 / 50 if i >= 49 and bad_50 == 0 else np.nan
+
+
+@njit(
+    types.UniTuple(types.float64, 2)(types.float64, types.float64, types.float64, types.float64),
+    cache=True
+)
+def _ewm_step(ema: float, old_wt: float, value: float, alpha: float):
+    """
+    One step of pandas ewm(adjust=False).mean() with ignore_na=False
+    
+    A missing value keeps the EMA and decays the weight of the history,
+    so the next observation is blended as if the gap had been there.
+    
+    Returns:
+        Tuple of (ema, old_wt) after the step
+    """
+    if not np.isfinite(value):
+        if np.isfinite(ema):
+            old_wt *= 1 - alpha
+        return ema, old_wt
+    if not np.isfinite(ema):
+        return value, 1.0
+    old_wt *= 1 - alpha
+    if ema != value:
+        ema = (old_wt * ema + alpha * value) / (old_wt + alpha)
+    return ema, 1.0
+
+
+@njit(types.void(_F8_IN, _F4_OUT, _F4_OUT), cache=True)
+def _macd(close: np.ndarray, macd: np.ndarray, signal: np.ndarray) -> None:
+    """
+    MACD line and signal line in one fused EMA recurrence
+    
+    Equivalent to pandas ewm(span=12/26/9, adjust=False) seeded with the
+    first observation. Outputs are NaN only before the first finite close.
+    """
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    alpha_9 = 2.0 / 10.0
+    ema_12 = np.nan
+    ema_26 = np.nan
+    macd_sig = np.nan
+    wt_12 = 1.0
+    wt_26 = 1.0
+    wt_9 = 1.0
+    
+    for i in range(close.shape[0]):
+        ema_12, wt_12 = _ewm_step(ema_12, wt_12, close[i], alpha_12)
+        ema_26, wt_26 = _ewm_step(ema_26, wt_26, close[i], alpha_26)
+        m = ema_12 - ema_26
+        macd_sig, wt_9 = _ewm_step(macd_sig, wt_9, m, alpha_9)
+        macd[i] = m
+        signal[i] = macd_sig
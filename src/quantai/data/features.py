@@ -5,13 +5,21 @@ Feature Engineering - Creates ML features from market data
 import pandas as pd
 import numpy as np
 from typing import Tuple
+from ._kernels import _macd, _rolling_bundle, _rsi
 
 
 class FeatureEngineer:
     """Creates technical features for ML models"""
     
+    FEATURE_COLUMNS = [
+        'Returns', 'SMA_5', 'SMA_20', 'SMA_50',
+        'MACD', 'MACD_Signal', 'RSI', 'Volatility_20',
+        'BB_Width', 'Momentum_10', 'Momentum_20', 'Volume_Ratio'
+    ]
+    
     def __init__(self, data: pd.DataFrame):
-        self.data = data.copy()
+        self.data = data
+        self._feat_buf = np.empty((len(data), len(self.FEATURE_COLUMNS)), dtype=np.float32)
         self._features: pd.DataFrame = None
         self._target: pd.Series = None
     
@@ -19,60 +27,92 @@ class FeatureEngineer:
         """
         Create technical indicators and target variable
         
+        Features are written column by column into one float32 buffer
+        allocated at construction; the returned DataFrame is a view over
+        the rows that have no missing values.
+        
         Returns:
             Tuple of (features DataFrame, target Series)
         """
-        df = self.data.copy()
+        close = self.data['Close'].to_numpy(dtype=np.float64)
+        n = len(close)
         
-        df['Returns'] = df['Close'].pct_change()
+        if self._feat_buf.shape[0] != n:
+            self._feat_buf = np.empty((n, len(self.FEATURE_COLUMNS)), dtype=np.float32)
+        buf = self._feat_buf
         
-        df['SMA_5'] = df['Close'].rolling(window=5).mean()
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
+        returns = self._pct_change(close, 1, np.empty(n))
+        buf[:, 0] = returns
         
-        df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
-        df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
-        df['MACD'] = df['EMA_12'] - df['EMA_26']
-        df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
+        _rolling_bundle(close, buf[:, 1], buf[:, 2], buf[:, 3], buf[:, 8])
         
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        df['RSI'] = 100 - (100 / (1 + rs))
+        _macd(close, buf[:, 4], buf[:, 5])
         
-        df['Volatility_20'] = df['Returns'].rolling(window=20).std() * np.sqrt(252)
+        delta = np.empty(n)
+        delta[:1] = 0.0
+        np.subtract(close[1:], close[:-1], out=delta[1:])
+        # fmax maps a NaN delta to 0 like delta.where(delta > 0, 0) does
+        gain = np.fmax(delta, 0.0)
+        loss = np.negative(delta, out=delta)
+        np.fmax(loss, 0.0, out=loss)
+        _rsi(gain, loss, 14, buf[:, 6])
         
-        df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-        df['BB_Std'] = df['Close'].rolling(window=20).std()
-        df['BB_Upper'] = df['BB_Middle'] + (df['BB_Std'] * 2)
-        df['BB_Lower'] = df['BB_Middle'] - (df['BB_Std'] * 2)
-        df['BB_Width'] = (df['BB_Upper'] - df['BB_Lower']) / df['BB_Middle']
+        buf[:19, 7] = np.nan
+        if n >= 20:
+            windows = np.lib.stride_tricks.sliding_window_view(returns, 20)
+            np.multiply(windows.std(axis=1, ddof=1), np.sqrt(252), out=buf[19:, 7])
         
-        df['Momentum_10'] = df['Close'].pct_change(periods=10)
-        df['Momentum_20'] = df['Close'].pct_change(periods=20)
+        self._pct_change(close, 10, buf[:, 9])
+        self._pct_change(close, 20, buf[:, 10])
         
-        if 'Volume' in df.columns:
-            df['Volume_SMA_20'] = df['Volume'].rolling(window=20).mean()
-            df['Volume_Ratio'] = df['Volume'] / df['Volume_SMA_20']
+        if 'Volume' in self.data.columns:
+            volume_series = self.data['Volume']
+            volume = volume_series.to_numpy(dtype=np.float64)
+            np.divide(volume, volume_series.rolling(window=20).mean().to_numpy(), out=buf[:, 11])
         else:
-            df['Volume_Ratio'] = 1.0
+            buf[:, 11] = 1.0
         
-        df['Target'] = (df['Returns'].shift(-1) > 0).astype(int)
+        target = np.zeros(n, dtype=np.int8)
+        np.greater(returns[1:], 0, out=target[:-1])
         
-        df = df.dropna()
+        rows = self._complete_rows(buf)
         
-        feature_columns = [
-            'Returns', 'SMA_5', 'SMA_20', 'SMA_50',
-            'MACD', 'MACD_Signal', 'RSI', 'Volatility_20',
-            'BB_Width', 'Momentum_10', 'Momentum_20', 'Volume_Ratio'
-        ]
-        
-        self._features = df[feature_columns]
-        self._target = df['Target']
+        self._features = pd.DataFrame(
+            buf[rows],
+            index=self.data.index[rows],
+            columns=self.FEATURE_COLUMNS,
+            copy=False
+        )
+        self._target = pd.Series(target[rows], index=self._features.index, name='Target')
         
         return self._features, self._target
     
+    @staticmethod
+    def _pct_change(close: np.ndarray, periods: int, out: np.ndarray) -> np.ndarray:
+        """Write close[t] / close[t - periods] - 1 into out, NaN for the first rows"""
+        out[:periods] = np.nan
+        if periods < len(close):
+            np.divide(close[periods:], close[:-periods], out=out[periods:])
+            out[periods:] -= 1
+        return out
+    
+    @staticmethod
+    def _complete_rows(buf: np.ndarray):
+        """
+        Select rows without NaN values
+        
+        Missing values normally only come from indicator warm-up at the
+        start, so a slice (a view) is returned when the valid rows are one
+        contiguous tail; otherwise a boolean mask is returned.
+        """
+        valid = ~np.isnan(buf).any(axis=1)
+        if not valid.any():
+            return slice(0, 0)
+        start = int(np.argmax(valid))
+        if valid[start:].all():
+            return slice(start, None)
+        return valid
+    
     @property
     def features(self) -> pd.DataFrame:
         """Get computed features"""
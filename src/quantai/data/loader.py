@@ -2,12 +2,15 @@
 Data Loader - Fetches market data from Yahoo Finance
 """
 
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
 from datetime import datetime, timedelta
 import pandas as pd
-import yfinance as yf
 from ..config import settings
 
+if TYPE_CHECKING:
+    import yfinance as yf
+
 
 class DataLoader:
     """Handles fetching and validating market data"""
@@ -16,11 +19,16 @@ class DataLoader:
         self.ticker = ticker.upper()
         self._data: Optional[pd.DataFrame] = None
         self._info: Optional[dict] = None
+        self._stock: Optional["yf.Ticker"] = None
+        self._info_thread: Optional[threading.Thread] = None
     
     def fetch(self, lookback_days: Optional[int] = None) -> pd.DataFrame:
         """
         Fetch historical data for the ticker
         
+        The ticker is validated by the history request itself; the slower
+        quote metadata (`Ticker.info`) is only requested on demand.
+        
         Args:
             lookback_days: Number of days of history to fetch
             
@@ -34,14 +42,14 @@ class DataLoader:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=int(days * 1.5))
         
+        import yfinance as yf
+        
         try:
-            stock = yf.Ticker(self.ticker)
-            self._info = stock.info
+            self._stock = yf.Ticker(self.ticker)
+            self._info = None
+            self._info_thread = None
             
-            if not self._info or self._info.get('regularMarketPrice') is None:
-                raise ValueError(f"Invalid ticker: {self.ticker}")
-            
-            self._data = stock.history(start=start_date, end=end_date)
+            self._data = self._stock.history(start=start_date, end=end_date)
             
             if self._data.empty:
                 raise ValueError(f"No data available for ticker: {self.ticker}")
@@ -55,6 +63,66 @@ class DataLoader:
                 raise
             raise ValueError(f"Failed to fetch data for {self.ticker}: {str(e)}")
     
+    @classmethod
+    def fetch_many(
+        cls,
+        tickers: List[str],
+        lookback_days: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical data for several tickers in one batched download
+        
+        Requests are issued concurrently by yfinance, so wall time is close
+        to a single round trip rather than one per ticker.
+        
+        Args:
+            tickers: Ticker symbols to fetch
+            lookback_days: Number of days of history to fetch
+            
+        Returns:
+            Dict of ticker -> OHLCV DataFrame; tickers without data are omitted
+            
+        Raises:
+            ValueError: If the batch download fails
+        """
+        symbols = list(dict.fromkeys(t.upper() for t in tickers))
+        if not symbols:
+            return {}
+        
+        days = lookback_days or settings.default_lookback_days
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=int(days * 1.5))
+        
+        import yfinance as yf
+        
+        try:
+            raw = yf.download(
+                symbols,
+                start=start_date,
+                end=end_date,
+                group_by='ticker',
+                auto_adjust=True,
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to fetch data for {', '.join(symbols)}: {str(e)}")
+        
+        results: Dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                frame = raw[symbol]
+            else:
+                frame = raw
+            
+            frame = frame.dropna(how='all')
+            if not frame.empty:
+                results[symbol] = frame.tail(days)
+        
+        return results
+    
     @property
     def data(self) -> pd.DataFrame:
         """Get the fetched data"""
@@ -62,18 +130,47 @@ class DataLoader:
             raise ValueError("Data not fetched. Call fetch() first.")
         return self._data
     
+    @property
+    def info(self) -> dict:
+        """Get ticker metadata, fetched on first access and memoized"""
+        if self._info is None:
+            if self._info_thread is not None:
+                self._info_thread.join()
+            elif self._stock is None:
+                return {}
+            else:
+                self._load_info()
+        return self._info
+    
+    def prefetch_info(self) -> None:
+        """
+        Start requesting ticker metadata in a background thread
+        
+        Callers that will read company_name later can overlap the slow
+        `Ticker.info` round trip with other work; `info` waits for it.
+        """
+        if self._info is None and self._stock is not None and self._info_thread is None:
+            self._info_thread = threading.Thread(target=self._load_info, daemon=True)
+            self._info_thread.start()
+    
+    def _load_info(self) -> None:
+        """Request ticker metadata, falling back to an empty dict on failure"""
+        try:
+            self._info = self._stock.info or {}
+        except Exception:
+            self._info = {}
+    
     @property
     def company_name(self) -> str:
         """Get the company name"""
-        if self._info:
-            return self._info.get('longName', self._info.get('shortName', self.ticker))
+        info = self.info
+        if info:
+            return info.get('longName', info.get('shortName', self.ticker))
         return self.ticker
     
     @property
     def current_price(self) -> float:
         """Get the current price"""
-        if self._info:
-            return self._info.get('regularMarketPrice', 0.0)
         if self._data is not None and not self._data.empty:
             return float(self._data['Close'].iloc[-1])
-        return 0.0
+        return self.info.get('regularMarketPrice', 0.0)
@@ -5,15 +5,23 @@ Uses SQLAlchemy with SQLite for trade signal persistence
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Set
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime
+from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
 
 Base = declarative_base()
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Enable WAL journaling so commits do not fsync the main database file"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 class TradeSignal(Base):
     """Trade Signal Model - stores analysis results"""
     
@@ -38,14 +46,34 @@ class TradeSignal(Base):
         )
 
 
+# Columns a caller supplies; id and timestamp are filled in by the database
+_SIGNAL_COLUMNS = (
+    "ticker", "regime", "regime_name", "signal_strength", "model_allocation",
+    "current_price", "xgb_confidence", "elastic_confidence", "ensemble_direction"
+)
+
+_INSERT = TradeSignal.__table__.insert()
+_INSERT_RETURNING_ID = _INSERT.returning(
+    TradeSignal.__table__.c.id, sort_by_parameter_order=True
+)
+
+
 class DatabaseManager:
     """Manages database connections and operations"""
     
+    _created: Set[Path] = set()
+    
     def __init__(self, db_path: str = "trade_history.db"):
         self.db_path = Path(db_path)
         self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
-        Base.metadata.create_all(self.engine)
-        self.Session = sessionmaker(bind=self.engine)
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        
+        schema_key = self.db_path.resolve()
+        if schema_key not in DatabaseManager._created or not self.db_path.exists():
+            Base.metadata.create_all(self.engine)
+            DatabaseManager._created.add(schema_key)
+        
+        self.Session = scoped_session(sessionmaker(bind=self.engine))
     
     def save_signal(
         self,
@@ -62,6 +90,9 @@ class DatabaseManager:
         """
         Save a trade signal to the database
         
+        Writes go through SQLAlchemy Core rather than the ORM; there is no
+        need for a mapped object or unit-of-work flush to insert one row.
+        
         Args:
             ticker: Stock ticker symbol
             regime: Regime index (0=bearish, 1=neutral, 2=bullish)
@@ -76,28 +107,45 @@ class DatabaseManager:
         Returns:
             ID of the saved signal
         """
-        session = self.Session()
-        try:
-            signal = TradeSignal(
-                ticker=ticker.upper(),
-                regime=regime,
-                regime_name=regime_name,
-                signal_strength=signal_strength,
-                model_allocation=model_allocation,
-                current_price=current_price,
-                xgb_confidence=xgb_confidence,
-                elastic_confidence=elastic_confidence,
-                ensemble_direction=ensemble_direction
-            )
-            session.add(signal)
-            session.commit()
-            signal_id = signal.id
-            return signal_id
-        except SQLAlchemyError as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        with self.engine.begin() as conn:
+            result = conn.execute(_INSERT, {
+                "ticker": ticker.upper(),
+                "regime": regime,
+                "regime_name": regime_name,
+                "signal_strength": signal_strength,
+                "model_allocation": model_allocation,
+                "current_price": current_price,
+                "xgb_confidence": xgb_confidence,
+                "elastic_confidence": elastic_confidence,
+                "ensemble_direction": ensemble_direction
+            })
+            return result.inserted_primary_key[0]
+    
+    def save_signals(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save a batch of trade signals in a single transaction
+        
+        Every row is expanded to the full column set, because an
+        executemany compiles one INSERT for all rows; optional keys left
+        out of some rows are stored as NULL, as in save_signal.
+        
+        Args:
+            rows: Signal dicts with the same keys as save_signal's arguments
+            
+        Returns:
+            IDs of the saved signals, in input order
+        """
+        if not rows:
+            return []
+        
+        params = [
+            {**{col: row.get(col) for col in _SIGNAL_COLUMNS}, "ticker": row["ticker"].upper()}
+            for row in rows
+        ]
+        
+        with self.engine.begin() as conn:
+            result = conn.execute(_INSERT_RETURNING_ID, params)
+            return list(result.scalars())
     
     def get_signals_by_ticker(self, ticker: str, limit: int = 10) -> List[TradeSignal]:
         """Get recent signals for a specific ticker"""
@@ -112,7 +160,7 @@ class DatabaseManager:
             )
             return signals
         finally:
-            session.close()
+            self.Session.remove()
     
     def get_all_signals(self, limit: int = 50) -> List[TradeSignal]:
         """Get all recent signals"""
@@ -126,7 +174,7 @@ class DatabaseManager:
             )
             return signals
         finally:
-            session.close()
+            self.Session.remove()
 
 
 _db_manager: Optional[DatabaseManager] = None
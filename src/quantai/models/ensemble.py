@@ -2,10 +2,12 @@
 Ensemble Predictor - Combines multiple models
 """
 
+import math
+import numpy as np
 import pandas as pd
 from typing import Dict, List
 from .trees import XGBoostPredictor
-from .linear import ElasticNetPredictor
+from .linear import ElasticNetPredictor, fit_standardization
 
 
 class EnsemblePredictor:
@@ -18,19 +20,37 @@ class EnsemblePredictor:
         self._ensemble_confidence: float = None
         self._win_probability: float = None
     
-    def fit_predict(self, X: pd.DataFrame, y: pd.Series) -> Dict:
+    def fit_predict(self, X: pd.DataFrame, y: pd.Series, test_size: float = 0.2) -> Dict:
         """
         Train all models and get ensemble prediction
         
+        Features are converted once to a C-contiguous float32 matrix that
+        both models share, instead of each model re-materialising the frame.
+        Standardization statistics come from the training split and are
+        applied here once, so the linear model receives pre-scaled input.
+        
         Args:
             X: Feature DataFrame
             y: Target Series
+            test_size: Fraction for test set, shared by both models
             
         Returns:
             Dictionary with ensemble results
         """
-        xgb_pred, xgb_conf = self.xgb.fit_predict(X, y)
-        elastic_pred, elastic_conf = self.elastic.fit_predict(X, y)
+        X_np = np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+        y_np = y.to_numpy(dtype=np.int8)
+        
+        # Same boundary as train_test_split(X[:-1], test_size, shuffle=False),
+        # which puts ceil(test_size * n) rows in the test split
+        n_history = len(X_np) - 1
+        n_train = n_history - math.ceil(test_size * n_history)
+        mu, sigma = fit_standardization(X_np[:n_train])
+        X_scaled = (X_np - mu) / sigma
+        
+        xgb_pred, xgb_conf = self.xgb.fit_predict(X_np, y_np, test_size=test_size)
+        elastic_pred, elastic_conf = self.elastic.fit_predict(
+            X_scaled, y_np, test_size=test_size, prescaled=True
+        )
         
         weights = {
             'xgb': 0.6,
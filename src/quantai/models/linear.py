@@ -1,48 +1,85 @@
 """
-Linear Models - ElasticNet implementation using sklearn Pipeline
+Linear Models - ElasticNet logistic regression on standardized features
 """
 
 import numpy as np
 import pandas as pd
-from typing import Tuple
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import SGDClassifier
-from sklearn.preprocessing import StandardScaler
-from sklearn.pipeline import Pipeline
+from typing import TYPE_CHECKING, Tuple, Union
+
+if TYPE_CHECKING:
+    from sklearn.linear_model import LogisticRegression
+
+
+def fit_standardization(X_train: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and standard deviation of the training rows, for z-scoring
+    
+    A small epsilon keeps constant columns from dividing by zero.
+    """
+    return X_train.mean(axis=0), X_train.std(axis=0) + 1e-8
+
+
+def _elasticnet_penalty_kwargs() -> dict:
+    """
+    Keyword arguments selecting the elastic-net penalty
+    
+    scikit-learn 1.8 deprecated `penalty` in favour of setting `l1_ratio`
+    alone; older releases still need `penalty='elasticnet'`.
+    """
+    import sklearn
+    
+    major, minor = (int(part) for part in sklearn.__version__.split('.')[:2])
+    if (major, minor) >= (1, 8):
+        return {'l1_ratio': 0.5}
+    return {'penalty': 'elasticnet', 'l1_ratio': 0.5}
 
 
 class ElasticNetPredictor:
-    """SGD Classifier with ElasticNet regularization for market prediction"""
+    """Logistic regression with ElasticNet regularization for market prediction
+    
+    Uses the saga solver instead of SGD. On the ~250-1000 x 12 feature
+    matrices seen here it needs up to a few hundred epochs; max_iter
+    leaves headroom so fits do not stop early with a ConvergenceWarning.
+    """
     
     def __init__(self):
-        self.pipeline: Pipeline = None
+        self.model: "LogisticRegression" = None
         self._accuracy: float = None
         self._prediction: int = None
         self._confidence: float = None
     
     def fit_predict(
         self,
-        X: pd.DataFrame,
-        y: pd.Series,
-        test_size: float = 0.2
+        X: Union[np.ndarray, pd.DataFrame],
+        y: Union[np.ndarray, pd.Series],
+        test_size: float = 0.2,
+        prescaled: bool = False
     ) -> Tuple[int, float]:
         """
         Train ElasticNet model and make prediction on latest data
         
-        Uses sklearn Pipeline to prevent data leakage - scaler is fitted
-        only on training data within the pipeline.
+        To prevent data leakage, features are standardized with statistics
+        from the training split only. Callers that already did this (the
+        ensemble) pass prescaled=True to skip it.
         
         Args:
-            X: Feature DataFrame
-            y: Target Series
+            X: Feature matrix (ndarray or DataFrame)
+            y: Target vector (ndarray or Series)
             test_size: Fraction for test set
+            prescaled: Whether X is already standardized on the training split
             
         Returns:
             Tuple of (prediction, confidence)
         """
-        X_train_test = X.iloc[:-1]
-        y_train_test = y.iloc[:-1]
-        X_latest = X.iloc[-1:]
+        from sklearn.model_selection import train_test_split
+        from sklearn.linear_model import LogisticRegression
+        
+        X = np.asarray(X)
+        y = np.asarray(y)
+        
+        X_train_test = X[:-1]
+        y_train_test = y[:-1]
+        X_latest = X[-1:]
         
         X_train, X_test, y_train, y_test = train_test_split(
             X_train_test, y_train_test,
@@ -50,29 +87,27 @@ class ElasticNetPredictor:
             shuffle=False
         )
         
-        self.pipeline = Pipeline([
-            ('scaler', StandardScaler()),
-            ('classifier', SGDClassifier(
-                loss='log_loss',
-                penalty='elasticnet',
-                l1_ratio=0.5,
-                alpha=0.001,
-                max_iter=2000,
-                tol=1e-4,
-                random_state=42,
-                early_stopping=True,
-                validation_fraction=0.1,
-                n_iter_no_change=10
-            ))
-        ])
+        if not prescaled:
+            mu, sigma = fit_standardization(X_train)
+            X_train = (X_train - mu) / sigma
+            X_test = (X_test - mu) / sigma
+            X_latest = (X_latest - mu) / sigma
+        
+        self.model = LogisticRegression(
+            C=1.0,
+            solver='saga',
+            max_iter=1000,
+            random_state=42,
+            **_elasticnet_penalty_kwargs()
+        )
         
-        self.pipeline.fit(X_train, y_train)
+        self.model.fit(X_train, y_train)
         
-        self._accuracy = self.pipeline.score(X_test, y_test)
+        self._accuracy = self.model.score(X_test, y_test)
         
-        self._prediction = int(self.pipeline.predict(X_latest)[0])
+        self._prediction = int(self.model.predict(X_latest)[0])
         
-        proba = self.pipeline.predict_proba(X_latest)[0]
+        proba = self.model.predict_proba(X_latest)[0]
         self._confidence = float(max(proba))
         
         return self._prediction, self._confidence
@@ -4,9 +4,10 @@ Tree-based Models - HistGradientBoosting implementation (sklearn native)
 
 import numpy as np
 import pandas as pd
-from typing import Tuple
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import HistGradientBoostingClassifier
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from sklearn.ensemble import HistGradientBoostingClassifier
 
 
 class XGBoostPredictor:
@@ -14,59 +15,117 @@ class XGBoostPredictor:
     
     Uses sklearn's HistGradientBoostingClassifier as a lightweight alternative
     to XGBoost while maintaining similar performance characteristics.
+    
+    Repeated calls on the same instance are incremental: identical inputs
+    return the cached result, and a training set that extends the previous
+    one row-for-row (the same series with new bars appended) warm-starts the
+    existing ensemble with WARM_START_ITERS extra trees. That is a cheaper
+    approximation, not the model a full refit would produce. Any other input,
+    such as a different ticker, gets a freshly fitted model.
     """
     
+    MAX_ITER = 100
+    WARM_START_ITERS = 10
+    
     def __init__(self):
-        self.model: HistGradientBoostingClassifier = None
+        self.model: "HistGradientBoostingClassifier" = None
         self._accuracy: float = None
         self._prediction: int = None
         self._confidence: float = None
+        self._fingerprint: Optional[Tuple] = None
+        self._train_rows: Optional[Tuple[int, bytes, bytes]] = None
     
     def fit_predict(
         self,
-        X: pd.DataFrame,
-        y: pd.Series,
+        X: Union[np.ndarray, pd.DataFrame],
+        y: Union[np.ndarray, pd.Series],
         test_size: float = 0.2
     ) -> Tuple[int, float]:
         """
         Train HistGradientBoosting model and make prediction on latest data
         
         Args:
-            X: Feature DataFrame
-            y: Target Series
+            X: Feature matrix (ndarray or DataFrame)
+            y: Target vector (ndarray or Series)
             test_size: Fraction for test set
             
         Returns:
             Tuple of (prediction, confidence)
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        
+        # HGBT validates inputs to float64 before binning to uint8, so a
+        # float32 matrix would be upcast separately in fit and predict_proba.
+        # Convert once here; the train and eval slices are then used as-is.
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y)
+        
+        # Full bytes rather than hashes, so a collision can never serve a
+        # stale prediction; bytes equality is a length check plus memcmp
+        fingerprint = (X.shape, test_size, X.tobytes(), y.tobytes())
+        if self.model is not None and fingerprint == self._fingerprint:
+            return self._prediction, self._confidence
+        
         X_train, X_test, y_train, y_test = train_test_split(
-            X.iloc[:-1], y.iloc[:-1],
+            X[:-1], y[:-1],
             test_size=test_size,
             shuffle=False
         )
         
-        self.model = HistGradientBoostingClassifier(
-            max_iter=100,
-            max_depth=5,
-            learning_rate=0.1,
-            random_state=42,
-            early_stopping=True,
-            validation_fraction=0.1,
-            n_iter_no_change=10
-        )
+        if self._can_warm_start(X_train, y_train):
+            self.model.set_params(
+                warm_start=True,
+                max_iter=self.model.n_iter_ + self.WARM_START_ITERS
+            )
+        else:
+            self.model = HistGradientBoostingClassifier(
+                max_iter=self.MAX_ITER,
+                max_depth=5,
+                learning_rate=0.1,
+                random_state=42,
+                early_stopping=True,
+                validation_fraction=0.1,
+                n_iter_no_change=10
+            )
         
         self.model.fit(X_train, y_train)
         
-        self._accuracy = self.model.score(X_test, y_test)
+        # Test rows and the latest row are contiguous in X, so a single
+        # predict_proba covers both the accuracy and the live prediction
+        proba = self.model.predict_proba(X[len(X_train):])
+        labels = self.model.classes_[np.argmax(proba, axis=1)]
+        self._accuracy = float(np.mean(labels[:-1] == y_test))
         
-        latest_features = X.iloc[-1:]
-        self._prediction = int(self.model.predict(latest_features)[0])
+        self._prediction = int(labels[-1])
+        self._confidence = float(proba[-1].max())
         
-        proba = self.model.predict_proba(X.iloc[-1:])[0]
-        self._confidence = float(max(proba))
+        self._fingerprint = fingerprint
+        self._train_rows = (len(X_train), X_train.tobytes(), y_train.tobytes())
         
         return self._prediction, self._confidence
     
+    def _can_warm_start(self, X_train: np.ndarray, y_train: np.ndarray) -> bool:
+        """Whether the fitted ensemble can be extended instead of refitted
+        
+        Requires the previous training rows to be an exact prefix of the new
+        ones, so the existing trees were grown on this same history, and caps
+        growth at twice MAX_ITER so a long-running session does not
+        accumulate trees indefinitely.
+        """
+        if self.model is None or self._train_rows is None:
+            return False
+        if self.model.n_iter_ + self.WARM_START_ITERS > 2 * self.MAX_ITER:
+            return False
+        
+        prev_n, prev_X, prev_y = self._train_rows
+        if len(X_train) < prev_n or X_train.shape[1] != self.model.n_features_in_:
+            return False
+        return (
+            X_train[:prev_n].tobytes() == prev_X
+            and y_train[:prev_n].tobytes() == prev_y
+        )
+    
     @property
     def prediction(self) -> int:
         """Get prediction (1=up, 0=down)"""
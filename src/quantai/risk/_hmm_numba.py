@@ -0,0 +1,238 @@
+"""
+Numba kernels for a Gaussian hidden Markov model over 1-D returns
+
+All inference runs in log space. Transition and emission terms are combined
+inline, so no K x K temporary is built per time step. Kernels release the
+GIL, so independent series can be fitted concurrently from threads.
+"""
+
+from typing import Tuple
+import numpy as np
+from numba import njit
+
+LOG2PI = np.log(2.0 * np.pi)
+
+# Fast-math without the "no NaN / no inf" assumptions: log-space values are
+# legitimately -inf when a transition or start probability is zero.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _fill_logpdf(x: np.ndarray, mu: np.ndarray, var: np.ndarray, log_B: np.ndarray) -> None:
+    """Write log N(x[t] | mu[k], var[k]) into a preallocated log_B[T, K]
+    
+    Observations are scalar, so each state has a single variance: the
+    normaliser and reciprocal are computed once per state and the inner
+    loop is a multiply-add per observation, with no log or division.
+    """
+    T = x.shape[0]
+    K = mu.shape[0]
+    log_norm = np.empty(K)
+    half_inv_var = np.empty(K)
+    for k in range(K):
+        log_norm[k] = -0.5 * (LOG2PI + np.log(var[k]))
+        half_inv_var[k] = 0.5 / var[k]
+    
+    for t in range(T):
+        for k in range(K):
+            d = x[t] - mu[k]
+            log_B[t, k] = log_norm[k] - d * d * half_inv_var[k]
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def gaussian_logpdf(x: np.ndarray, mu: np.ndarray, var: np.ndarray) -> np.ndarray:
+    """Log emission matrix log_B[t, k] = log N(x[t] | mu[k], var[k])"""
+    log_B = np.empty((x.shape[0], mu.shape[0]))
+    _fill_logpdf(x, mu, var, log_B)
+    return log_B
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _logsumexp(a: np.ndarray) -> float:
+    """Numerically stable log(sum(exp(a))) over a 1-D array"""
+    m = -np.inf
+    for i in range(a.shape[0]):
+        if a[i] > m:
+            m = a[i]
+    if m == -np.inf:
+        return -np.inf
+    s = 0.0
+    for i in range(a.shape[0]):
+        s += np.exp(a[i] - m)
+    return m + np.log(s)
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _forward_backward_into(
+    log_pi: np.ndarray,
+    log_A: np.ndarray,
+    log_B: np.ndarray,
+    log_alpha: np.ndarray,
+    log_beta: np.ndarray,
+    gamma: np.ndarray,
+    xi_sum: np.ndarray,
+    work: np.ndarray
+) -> float:
+    """
+    Forward-backward pass in log space into caller-provided buffers
+    
+    log_alpha, log_beta and gamma are [T, K], xi_sum is [K, K] and work is
+    [K]. All are overwritten.
+    
+    Returns:
+        Total log-likelihood
+    """
+    T, K = log_B.shape
+    
+    for k in range(K):
+        log_alpha[0, k] = log_pi[k] + log_B[0, k]
+    for t in range(1, T):
+        for j in range(K):
+            for i in range(K):
+                work[i] = log_alpha[t - 1, i] + log_A[i, j]
+            log_alpha[t, j] = _logsumexp(work) + log_B[t, j]
+    
+    log_likelihood = _logsumexp(log_alpha[T - 1])
+    
+    for k in range(K):
+        log_beta[T - 1, k] = 0.0
+    for t in range(T - 2, -1, -1):
+        for i in range(K):
+            for j in range(K):
+                work[j] = log_A[i, j] + log_B[t + 1, j] + log_beta[t + 1, j]
+            log_beta[t, i] = _logsumexp(work)
+    
+    for t in range(T):
+        for k in range(K):
+            gamma[t, k] = np.exp(log_alpha[t, k] + log_beta[t, k] - log_likelihood)
+    
+    xi_sum[:, :] = 0.0
+    for t in range(T - 1):
+        for i in range(K):
+            for j in range(K):
+                xi_sum[i, j] += np.exp(
+                    log_alpha[t, i] + log_A[i, j] + log_B[t + 1, j]
+                    + log_beta[t + 1, j] - log_likelihood
+                )
+    
+    return log_likelihood
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def forward_backward(
+    log_pi: np.ndarray,
+    log_A: np.ndarray,
+    log_B: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Forward-backward pass in log space
+    
+    Returns:
+        Tuple of (gamma[T, K] state posteriors, xi_sum[K, K] expected
+        transition counts, total log-likelihood)
+    """
+    T, K = log_B.shape
+    gamma = np.empty((T, K))
+    xi_sum = np.empty((K, K))
+    log_likelihood = _forward_backward_into(
+        log_pi, log_A, log_B,
+        np.empty((T, K)), np.empty((T, K)), gamma, xi_sum, np.empty(K)
+    )
+    return gamma, xi_sum, log_likelihood
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def baum_welch(
+    x: np.ndarray,
+    pi: np.ndarray,
+    A: np.ndarray,
+    mu: np.ndarray,
+    var: np.ndarray,
+    n_iter: int,
+    tol: float,
+    min_var: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Fit HMM parameters with expectation-maximization
+    
+    Stops after n_iter iterations or once the log-likelihood gain drops
+    below tol. Variances are floored at min_var to avoid a state collapsing
+    onto a single observation.
+    
+    Returns:
+        Tuple of (log_pi, log_A, means, variances, log-likelihood)
+    """
+    T = x.shape[0]
+    K = mu.shape[0]
+    pi = pi.copy()
+    A = A.copy()
+    mu = mu.copy()
+    var = var.copy()
+    prev_ll = -np.inf
+    log_likelihood = -np.inf
+    
+    # E-step buffers are allocated once and overwritten every iteration
+    log_B = np.empty((T, K))
+    log_alpha = np.empty((T, K))
+    log_beta = np.empty((T, K))
+    gamma = np.empty((T, K))
+    xi_sum = np.empty((K, K))
+    work = np.empty(K)
+    
+    for _ in range(n_iter):
+        _fill_logpdf(x, mu, var, log_B)
+        log_likelihood = _forward_backward_into(
+            np.log(pi), np.log(A), log_B, log_alpha, log_beta, gamma, xi_sum, work
+        )
+        
+        for k in range(K):
+            pi[k] = gamma[0, k]
+        
+        for i in range(K):
+            row = 0.0
+            for j in range(K):
+                row += xi_sum[i, j]
+            if row > 0:
+                for j in range(K):
+                    A[i, j] = xi_sum[i, j] / row
+        
+        for k in range(K):
+            w = 0.0
+            wx = 0.0
+            for t in range(T):
+                w += gamma[t, k]
+                wx += gamma[t, k] * x[t]
+            if w <= 0:
+                continue
+            mu[k] = wx / w
+            wd = 0.0
+            for t in range(T):
+                d = x[t] - mu[k]
+                wd += gamma[t, k] * d * d
+            var[k] = max(wd / w, min_var)
+        
+        if log_likelihood - prev_ll < tol:
+            break
+        prev_ll = log_likelihood
+    
+    return np.log(pi), np.log(A), mu, var, log_likelihood
+
+
+def initial_params(
+    x: np.ndarray,
+    n_states: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Deterministic starting point for Baum-Welch
+    
+    Uniform start and transition probabilities, means spread over the
+    quantiles of the data and every variance set to the sample variance.
+    
+    Returns:
+        Tuple of (pi, A, means, variances)
+    """
+    pi = np.full(n_states, 1.0 / n_states)
+    A = np.full((n_states, n_states), 1.0 / n_states)
+    mu = np.quantile(x, (np.arange(n_states) + 0.5) / n_states)
+    var = np.full(n_states, max(float(np.var(x)), 1e-12))
+    return pi, A, mu, var
@@ -2,15 +2,103 @@
 Market Regime Detection using Hidden Markov Models
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import numpy as np
 import pandas as pd
-from typing import Dict
-from hmmlearn import hmm
+from typing import Dict, Optional, Tuple
 from ..config import settings
+from ._hmm_numba import baum_welch, forward_backward, gaussian_logpdf, initial_params
+
+
+@dataclass(frozen=True)
+class RegimeArtifacts:
+    """Fitted HMM parameters and the regime analysis derived from them
+    
+    Arrays are read-only because instances are shared through the fit cache.
+    """
+    
+    log_pi: np.ndarray
+    log_A: np.ndarray
+    means: np.ndarray
+    variances: np.ndarray
+    volatilities: np.ndarray
+    perm: np.ndarray
+    current_regime: int
+    regime_probs: np.ndarray
+    log_likelihood: float
+
+
+@functools.lru_cache(maxsize=128)
+def _fit_artifacts(returns_bytes: bytes, n_regimes: int) -> RegimeArtifacts:
+    """
+    Fit the HMM on a float64 returns buffer and derive regime artifacts
+    
+    Keyed on the raw bytes, so identical series across refreshes or symbols
+    are fitted once.
+    
+    Args:
+        returns_bytes: Cleaned daily returns as float64 bytes
+        n_regimes: Number of hidden states
+        
+    Returns:
+        RegimeArtifacts for the series
+    """
+    x = np.frombuffer(returns_bytes, dtype=np.float64)
+    K = n_regimes
+    
+    pi, A, means, variances = initial_params(x, K)
+    min_var = max(float(np.var(x)) * 1e-3, 1e-12)
+    log_pi, log_A, means, variances, log_likelihood = baum_welch(
+        x, pi, A, means, variances, 500, 1e-4, min_var
+    )
+    
+    # One forward-backward pass gives the smoothed posteriors; hard state
+    # assignments and the current state are their per-step argmax
+    gamma, _, _ = forward_backward(log_pi, log_A, gaussian_logpdf(x, means, variances))
+    hidden_states = np.argmax(gamma, axis=1)
+    
+    # Per-state sample std (ddof=1) from one pass of counts and moments
+    counts = np.bincount(hidden_states, minlength=K).astype(np.float64)
+    sums = np.bincount(hidden_states, weights=x, minlength=K)
+    sqs = np.bincount(hidden_states, weights=x * x, minlength=K)
+    var = np.divide(
+        sqs - sums * sums / np.maximum(counts, 1.0), counts - 1.0,
+        out=np.zeros(K), where=counts > 1
+    )
+    vols = np.sqrt(np.maximum(var, 0.0)) * np.sqrt(252)
+    
+    # Rank states by descending volatility: perm[new] = old
+    perm = np.argsort(-vols, kind="stable")
+    state_mapping = np.empty(K, dtype=np.int64)
+    state_mapping[perm] = np.arange(K)
+    
+    arrays = (log_pi, log_A, means, variances, vols, perm, gamma[-1][perm])
+    for arr in arrays:
+        arr.setflags(write=False)
+    
+    return RegimeArtifacts(
+        log_pi=log_pi,
+        log_A=log_A,
+        means=means,
+        variances=variances,
+        volatilities=vols,
+        perm=perm,
+        current_regime=int(state_mapping[hidden_states[-1]]),
+        regime_probs=arrays[-1],
+        log_likelihood=float(log_likelihood)
+    )
 
 
 class RegimeDetector:
-    """Detects market regimes using Hidden Markov Models"""
+    """Detects market regimes using Hidden Markov Models
+    
+    The Gaussian HMM is fitted with Numba-compiled Baum-Welch and decoded
+    from forward-backward posteriors (see _hmm_numba). Fits are memoized on the
+    content of the returns series, and a fitted detector only re-runs EM
+    when new data no longer scores like the data it was fitted on.
+    """
     
     REGIME_NAMES = {
         0: "HIGH VOL",
@@ -24,12 +112,17 @@ class RegimeDetector:
         2: "[LOW VOL]"
     }
     
+    # Relative change in per-observation log-likelihood that triggers a refit
+    REFIT_TOLERANCE = 0.05
+    
     def __init__(self, n_regimes: int = None):
         self.n_regimes = n_regimes or settings.n_regimes
-        self.model: hmm.GaussianHMM = None
+        self._fitted_params: Optional[Tuple[np.ndarray, ...]] = None
+        self._artifacts: Optional[RegimeArtifacts] = None
+        self._ll_at_fit: Optional[float] = None
         self._current_regime: int = None
         self._regime_probs: np.ndarray = None
-        self._volatilities: Dict[int, float] = {}
+        self._volatilities: Optional[np.ndarray] = None
     
     def fit_predict(self, returns: pd.Series) -> int:
         """
@@ -42,38 +135,81 @@ class RegimeDetector:
             Current regime index (0=bearish, 1=neutral, 2=bullish)
         """
         returns_clean = returns.dropna()
-        X = returns_clean.values.reshape(-1, 1)
+        x = np.ascontiguousarray(returns_clean.to_numpy(dtype=np.float64))
         
-        self.model = hmm.GaussianHMM(
-            n_components=self.n_regimes,
-            covariance_type="full",
-            n_iter=500,
-            tol=1e-4,
-            random_state=42,
-            init_params="stmc"
+        if self._artifacts is not None:
+            mean_ll, gamma = self._score_only(x)
+            drift = abs(mean_ll - self._ll_at_fit) / max(abs(self._ll_at_fit), 1e-12)
+            if drift < self.REFIT_TOLERANCE:
+                self._decode_with_fitted(gamma)
+                return self._current_regime
+        
+        artifacts = _fit_artifacts(x.tobytes(), self.n_regimes)
+        self._artifacts = artifacts
+        self._fitted_params = (
+            artifacts.log_pi, artifacts.log_A, artifacts.means, artifacts.variances
         )
+        self._ll_at_fit = artifacts.log_likelihood / len(x)
+        self._volatilities = artifacts.volatilities
+        self._current_regime = artifacts.current_regime
+        self._regime_probs = artifacts.regime_probs
         
-        self.model.fit(X)
+        return self._current_regime
+    
+    @classmethod
+    def fit_predict_many(
+        cls,
+        returns_dict: Dict[str, pd.Series],
+        n_regimes: int = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, "RegimeDetector"]:
+        """
+        Fit one detector per symbol concurrently
         
-        hidden_states = self.model.predict(X)
+        The HMM kernels release the GIL, so a thread pool fits the series
+        in parallel without process start-up or pickling.
         
-        for i in range(self.n_regimes):
-            state_returns = returns_clean[hidden_states == i]
-            self._volatilities[i] = state_returns.std() * np.sqrt(252) if len(state_returns) > 0 else 0
+        Args:
+            returns_dict: Mapping of symbol to daily returns
+            n_regimes: Number of regimes (defaults to settings)
+            max_workers: Thread count (defaults to the executor's choice)
+            
+        Returns:
+            Mapping of symbol to fitted RegimeDetector
+        """
+        detectors = {symbol: cls(n_regimes) for symbol in returns_dict}
         
-        sorted_states = sorted(self._volatilities.keys(), key=lambda x: self._volatilities[x], reverse=True)
-        state_mapping = {old: new for new, old in enumerate(sorted_states)}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(
+                lambda item: detectors[item[0]].fit_predict(item[1]),
+                returns_dict.items()
+            ))
         
-        raw_current = hidden_states[-1]
-        self._current_regime = state_mapping[raw_current]
+        return detectors
+    
+    def _score_only(self, x: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Score returns under the fitted parameters without running EM
         
-        self._regime_probs = self.model.predict_proba(X[-1:].reshape(-1, 1))[0]
-        reordered_probs = np.zeros(self.n_regimes)
-        for old, new in state_mapping.items():
-            reordered_probs[new] = self._regime_probs[old]
-        self._regime_probs = reordered_probs
+        Args:
+            x: Cleaned daily returns
+            
+        Returns:
+            Tuple of (mean log-likelihood per observation, state posteriors)
+        """
+        log_pi, log_A, means, variances = self._fitted_params
+        log_B = gaussian_logpdf(x, means, variances)
+        gamma, _, log_likelihood = forward_backward(log_pi, log_A, log_B)
+        return log_likelihood / len(x), gamma
+    
+    def _decode_with_fitted(self, gamma: np.ndarray) -> None:
+        """Update the current regime from posteriors under fitted parameters"""
+        perm = self._artifacts.perm
+        state_mapping = np.empty(self.n_regimes, dtype=np.int64)
+        state_mapping[perm] = np.arange(self.n_regimes)
         
-        return self._current_regime
+        self._current_regime = int(state_mapping[np.argmax(gamma[-1])])
+        self._regime_probs = gamma[-1][perm]
     
     @property
     def current_regime(self) -> int:
@@ -2,9 +2,11 @@
 Position Sizing using Kelly Criterion
 """
 
-from typing import Dict
+from typing import Dict, Tuple, Union
 import numpy as np
 
+ArrayLike = Union[float, np.ndarray]
+
 
 class KellySizer:
     """Calculates optimal position sizes using Kelly Criterion"""
@@ -39,25 +41,59 @@ class KellySizer:
         Returns:
             Recommended position size as fraction (0-max_position)
         """
-        if avg_loss == 0:
-            avg_loss = 0.01
+        kelly, adjusted = self._kelly(win_probability, avg_win, avg_loss, regime_factor)
         
-        win_prob = np.clip(win_probability, 0.01, 0.99)
-        loss_prob = 1 - win_prob
+        self._kelly_fraction = float(kelly)
+        self._adjusted_fraction = float(adjusted)
         
-        b = avg_win / avg_loss
+        return self._adjusted_fraction
+    
+    def calculate_batch(
+        self,
+        win_probability: ArrayLike,
+        avg_win: ArrayLike,
+        avg_loss: ArrayLike,
+        regime_factor: ArrayLike = 1.0
+    ) -> np.ndarray:
+        """
+        Calculate position sizes for many assets at once
         
-        kelly = (win_prob * b - loss_prob) / b
+        Arguments broadcast against each other, so scalars can be mixed
+        with per-asset arrays. Does not update the stored Kelly fractions.
         
-        self._kelly_fraction = max(0, kelly)
+        Args:
+            win_probability: Win probabilities (0-1)
+            avg_win: Average winning trade returns (positive)
+            avg_loss: Average losing trade returns (positive)
+            regime_factor: Regime multipliers (0.5-1.0)
+            
+        Returns:
+            Array of recommended position sizes (0-max_position)
+        """
+        return self._kelly(win_probability, avg_win, avg_loss, regime_factor)[1]
+    
+    def _kelly(
+        self,
+        win_probability: ArrayLike,
+        avg_win: ArrayLike,
+        avg_loss: ArrayLike,
+        regime_factor: ArrayLike
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Full and half-Kelly regime-adjusted fractions, branch-free"""
+        avg_loss = np.asarray(avg_loss, dtype=np.float64)
+        avg_loss = np.where(avg_loss == 0, 0.01, avg_loss)
         
-        half_kelly = self._kelly_fraction * 0.5
+        win_prob = np.clip(win_probability, 0.01, 0.99)
+        loss_prob = 1 - win_prob
         
-        regime_adjusted = half_kelly * regime_factor
+        b = np.asarray(avg_win, dtype=np.float64) / avg_loss
         
-        self._adjusted_fraction = min(regime_adjusted, self.max_position)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kelly = np.maximum(0.0, (win_prob * b - loss_prob) / b)
         
-        return self._adjusted_fraction
+        adjusted = np.minimum(kelly * 0.5 * regime_factor, self.max_position)
+        
+        return kelly, adjusted
     
     @property
     def full_kelly(self) -> float:
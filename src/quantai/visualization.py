@@ -5,7 +5,30 @@ Provides Bloomberg Terminal-style charts and sparklines
 
 import pandas as pd
 import numpy as np
-from typing import List
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Sparkline glyphs as ASCII codes, lowest level first
+CHAR_TABLE = np.frombuffer(b'_.-~^', dtype=np.uint8)
+
+# Prebuilt horizontal bars for common widths, indexed by filled cell count
+_BAR_CACHE = {
+    w: tuple(f"[{'#' * i}{'.' * (w - i)}]" for i in range(w + 1))
+    for w in (10, 20, 30, 50)
+}
+
+# Bound str.format methods for table rows, keyed by total row width
+_FMT_CACHE: Dict[int, Callable[..., str]] = {}
+
+
+def _make_fmt(width: int) -> Callable[[str, str], str]:
+    """Get the cached row formatter for a total table width"""
+    fmt = _FMT_CACHE.get(width)
+    if fmt is None:
+        label_width = 20
+        value_width = width - label_width - 3
+        fmt = f"| {{0:<{label_width}}} | {{1:<{value_width}}} |".format
+        _FMT_CACHE[width] = fmt
+    return fmt
 
 
 class ASCIIChart:
@@ -20,6 +43,8 @@ class ASCIIChart:
         'sparkline': ['_', '.', '-', '~', '^']
     }
     
+    TRENDS = (("DOWN", "v"), ("FLAT", "-"), ("UP", "^"))
+    
     @staticmethod
     def sparkline(data: pd.Series, width: int = 30) -> str:
         """
@@ -35,24 +60,24 @@ class ASCIIChart:
         if data.empty or len(data) < 2:
             return "-" * width
         
-        values = data.tail(width).values
+        values = data.to_numpy(dtype=np.float64)[-width:]
         
-        min_val = np.min(values)
-        max_val = np.max(values)
+        min_val = values.min()
+        max_val = values.max()
         
         if max_val == min_val:
             return "-" * len(values)
         
-        chars = ['_', '.', '-', '~', '^']
-        
-        normalized = (values - min_val) / (max_val - min_val)
-        
-        indices = (normalized * (len(chars) - 1)).astype(int)
-        indices = np.clip(indices, 0, len(chars) - 1)
+        # Scale in one float buffer; the index clip runs after the cast so
+        # NaN inputs still map to the lowest glyph as before
+        top = len(CHAR_TABLE) - 1
+        scaled = values - min_val
+        scaled /= max_val - min_val
+        scaled *= top
+        indices = scaled.astype(np.intp)
+        np.clip(indices, 0, top, out=indices)
         
-        sparkline = ''.join([chars[i] for i in indices])
-        
-        return sparkline
+        return CHAR_TABLE[indices].tobytes().decode('ascii')
     
     @staticmethod
     def horizontal_bar(value: float, max_value: float = 100, width: int = 20) -> str:
@@ -67,12 +92,17 @@ class ASCIIChart:
         Returns:
             ASCII bar string
         """
+        bars = _BAR_CACHE.get(width)
+        
         if max_value <= 0:
-            return '[' + '.' * width + ']'
+            return bars[0] if bars else '[' + '.' * width + ']'
         
         filled = int((value / max_value) * width)
         filled = max(0, min(width, filled))
         
+        if bars:
+            return bars[filled]
+        
         bar = '#' * filled + '.' * (width - filled)
         return f"[{bar}]"
     
@@ -91,18 +121,12 @@ class ASCIIChart:
         if len(prices) < days:
             return "N/A"
         
-        recent = prices.tail(days)
-        change = (recent.iloc[-1] - recent.iloc[0]) / recent.iloc[0] * 100
+        values = prices.to_numpy()
+        first = values[-days]
+        change = float((values[-1] - first) / first * 100)
         
-        if change > 1:
-            direction = "UP"
-            arrow = "^"
-        elif change < -1:
-            direction = "DOWN"
-            arrow = "v"
-        else:
-            direction = "FLAT"
-            arrow = "-"
+        # Index 0/1/2 for down/flat/up without an if-chain
+        direction, arrow = ASCIIChart.TRENDS[(change > 1) - (change < -1) + 1]
         
         return f"{arrow} {direction} ({change:+.2f}%)"
     
@@ -122,17 +146,14 @@ class ASCIIChart:
         if data.empty:
             return ["No data"]
         
-        hist, bin_edges = np.histogram(data.dropna(), bins=bins)
-        max_count = max(hist) if max(hist) > 0 else 1
-        
-        lines = []
-        for i, count in enumerate(hist):
-            bar_len = int((count / max_count) * width)
-            bar = '#' * bar_len
-            label = f"{bin_edges[i]:>7.2f}"
-            lines.append(f"{label} | {bar}")
+        values = data.to_numpy(dtype=np.float64)
+        hist, bin_edges = np.histogram(values[~np.isnan(values)], bins=bins)
+        bar_lens = hist * width // max(1, int(hist.max()))
         
-        return lines
+        return [
+            f"{edge:>7.2f} | {'#' * bar_len}"
+            for edge, bar_len in zip(bin_edges[:-1].tolist(), bar_lens.tolist())
+        ]
     
     @staticmethod
     def regime_indicator(regime: int) -> str:
@@ -187,6 +208,19 @@ class ASCIIChart:
         Returns:
             Formatted row string
         """
-        label_width = 20
-        value_width = width - label_width - 3
-        return f"| {label:<{label_width}} | {value:<{value_width}} |"
+        return _make_fmt(width)(label, value)
+    
+    @staticmethod
+    def format_rows(rows: Iterable[Tuple[str, str]], width: int = 50) -> str:
+        """
+        Format several table rows with one shared template
+        
+        Args:
+            rows: (label, value) pairs
+            width: Total width
+            
+        Returns:
+            Formatted rows joined by newlines
+        """
+        fmt = _make_fmt(width)
+        return "\n".join([fmt(label, value) for label, value in rows])
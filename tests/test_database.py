@@ -0,0 +1,57 @@
+"""
+Tests for the trade signal database
+"""
+
+from quantai.database import DatabaseManager
+
+
+def _row(ticker: str, **optional) -> dict:
+    return {
+        "ticker": ticker,
+        "regime": 0,
+        "regime_name": "Bull",
+        "signal_strength": 0.5,
+        "model_allocation": 0.25,
+        **optional,
+    }
+
+
+def test_save_signals_mixed_optional_keys(tmp_path):
+    """Rows missing optional keys must not drop or reject other rows' values"""
+    db = DatabaseManager(str(tmp_path / "signals.db"))
+    
+    ids = db.save_signals([
+        _row("aaa"),
+        _row("bbb", current_price=101.5, xgb_confidence=0.7),
+        _row("ccc", ensemble_direction="UP"),
+    ])
+    
+    assert len(ids) == 3
+    
+    (a,) = db.get_signals_by_ticker("AAA")
+    (b,) = db.get_signals_by_ticker("BBB")
+    (c,) = db.get_signals_by_ticker("CCC")
+    
+    assert a.current_price is None and a.xgb_confidence is None
+    assert b.current_price == 101.5 and b.xgb_confidence == 0.7
+    assert b.ensemble_direction is None
+    assert c.ensemble_direction == "UP" and c.current_price is None
+    assert [a.id, b.id, c.id] == ids
+
+
+def test_save_signals_full_row_first(tmp_path):
+    """A fully populated first row must not make later sparse rows fail"""
+    db = DatabaseManager(str(tmp_path / "signals.db"))
+    
+    ids = db.save_signals([
+        _row("aaa", current_price=10.0, xgb_confidence=0.6,
+             elastic_confidence=0.4, ensemble_direction="DOWN"),
+        _row("bbb"),
+    ])
+    
+    (a,) = db.get_signals_by_ticker("AAA")
+    (b,) = db.get_signals_by_ticker("BBB")
+    
+    assert a.current_price == 10.0 and a.ensemble_direction == "DOWN"
+    assert b.current_price is None and b.elastic_confidence is None
+    assert [a.id, b.id] == ids